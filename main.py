@@ -32,9 +32,12 @@ from stt.sttSpeaker import ClovaSpeakerAnalyzer, convert_language_code
 
 # --- 내부 모듈: AI 요약/할일 관련 ---
 from summary.summary_service import (
-    create_summary, 
-    SummaryRequest, 
-    SummaryResponse
+    create_summary,
+    SummaryRequest,
+    SummaryResponse,
+    init_client,
+    close_client,
+    warm_up
 )
 from summary.action_service import (
     generate_all_actions_service, 
@@ -63,6 +66,19 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def on_startup():
+    """공유 HTTP 클라이언트 초기화 + 콜드 패스 워밍업"""
+    await init_client()
+    await warm_up()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    """공유 HTTP 클라이언트 정리"""
+    await close_client()
+
+
 # ======================================================
 # 1. 기본 정보 및 헬스 체크
 # ======================================================
@@ -3,10 +3,17 @@
 
 import os
 import asyncio
+import atexit
+import hashlib
 import httpx
+import itertools
+import logging
+import logging.handlers
+import orjson
 import re
-import uuid
 import time
+from collections import OrderedDict
+from queue import SimpleQueue
 from datetime import datetime
 from dotenv import load_dotenv
 from pydantic import BaseModel
@@ -20,6 +27,83 @@ load_dotenv()
 CLOVA_API_KEY = os.getenv("CLOVA_API_KEY")
 CLOVA_API_URL = os.getenv("CLOVA_STUDIO_URL")
 
+# --- 로깅 (요청 경로 비차단) ---
+# print는 GIL을 잡은 채 stdout에 동기 기록해 이벤트 루프를 지연시킬 수 있으므로,
+# QueueHandler로 레코드만 큐에 넣고 백그라운드 스레드의 QueueListener가 기록합니다.
+logger = logging.getLogger(__name__)
+logger.propagate = False  # 루트 핸들러로 전파되면 동기 기록이 중복 발생
+if not logger.handlers:
+    _log_queue: "SimpleQueue" = SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    logger.setLevel(logging.INFO)
+    _log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+    _log_listener.start()
+    # 프로세스 종료 시 큐에 남은 레코드를 비우고 스레드 정리
+    atexit.register(_log_listener.stop)
+
+# --- 정규식 상수 (모듈 로드 시 1회 컴파일, 매 요청 재컴파일 방지) ---
+# 마크다운/따옴표 제거: 짧은 입력에서는 정규식 상태머신 오버헤드가 지배적이라
+# C 레벨 str.translate 1패스로 처리. **/__ 쌍은 별도 replace로 제거해
+# "2*3" 같은 본문 속 단일 */_ 는 보존합니다 (기존 정규식과 동일 동작).
+_MARKUP_TABLE = str.maketrans('', '', '#"\'')
+
+def _strip_markup(text: str) -> str:
+    return text.replace('**', '').replace('__', '').translate(_MARKUP_TABLE)
+
+# 키워드 전용 정크 문자 테이블 (백틱 포함, 마크다운 패스 없이 1회 translate)
+_KW_JUNK = str.maketrans('', '', '"\'`*#')
+
+_PURPOSE_PREFIX_RE = re.compile(r'^(회의\s*)?목적\s*[:\-]?\s*', re.IGNORECASE)
+_AGENDA_PREFIX_RE = re.compile(r'^(주요\s*)?안건\s*[:\-]?\s*', re.IGNORECASE)
+_SUMMARY_PREFIX_RE = re.compile(r'^(전체\s*)?요약\s*[:\-]?\s*', re.IGNORECASE)
+_KEYWORDS_PREFIX_RE = re.compile(r'^키워드\s*[:\-]?\s*', re.IGNORECASE)
+# 중요도 레벨 접두부와 '이유:' 접두부를 하나의 선택 패턴으로 융합 (1회 스캔)
+_IMP_PREFIX_RE = re.compile(
+    r'^(?:[\[\*\-\s]*(?:중요도(?:\s*평가)?\s*[:\-]?\s*)?[\*\s]*'
+    r'(?:HIGH|MEDIUM|LOW|높음|보통|낮음)[\]\*\s]*[-:]?\s*(?:이유\s*[:\-]?\s*)?'
+    r'|[\*\s]*이유\s*[:\-]?\s*)',
+    re.IGNORECASE,
+)
+_LEAD_DASH_RE = re.compile(r'^[\-\s]*')
+# 중요도 레벨 키워드: 우선순위(높음 > 낮음 > 보통) 순서로 탐색하고
+# 첫 매치에서 즉시 중단 (긴 사유 텍스트 전체 재스캔 방지)
+# 원문 분류용 테이블은 명시적 레벨 단어만 사용합니다. 동의어('긴급', '중요' 등)를
+# 넣으면 사유 문장 속 "중요 이슈는 없음" 같은 표현이 레벨을 뒤집습니다.
+_LEVEL_KEYWORDS = (
+    ('높음', ('높음', 'high')),
+    ('낮음', ('낮음', 'low')),
+    ('보통', ('보통', 'medium')),
+)
+# enum 매핑용 테이블: 입력이 깨끗한 레벨 문자열이므로 동의어를 허용합니다.
+_ENUM_KEYWORDS = (
+    ('HIGH', ('높음', '긴급', '중요', 'high', 'critical')),
+    ('LOW', ('낮음', '일상', '단순', 'low')),
+    ('MEDIUM', ('보통', 'medium')),
+)
+
+def _scan_keywords(lower_text: str, table, default: str) -> str:
+    for label, keywords in table:
+        for kw in keywords:
+            if lower_text.find(kw) != -1:
+                return label
+    return default
+
+def _classify_level(lower_text: str) -> str:
+    return _scan_keywords(lower_text, _LEVEL_KEYWORDS, '보통')
+
+# 통합 응답에서 JSON 블록 추출용
+_JSON_BLOCK_RE = re.compile(r'\{.*\}', re.DOTALL)
+# maxTokens 컷오프로 닫는 중괄호 없이 잘린 JSON에서 필드 단위로 추출하는 패턴
+_JSON_FIELD_RES = {
+    'purpose': re.compile(r'"purpose"\s*:\s*"([^"]*)'),
+    'agenda': re.compile(r'"agenda"\s*:\s*"([^"]*)'),
+    'overallSummary': re.compile(r'"overallSummary"\s*:\s*"([^"]*)'),
+    'importance': re.compile(r'"importance"\s*:\s*"([^"]*)'),
+}
+_JSON_KEYWORDS_RE = re.compile(r'"keywords"\s*:\s*\[([^\]]*)')
+# 라벨 라인 폴백에서 "중요도:" 라벨 제거용
+_IMP_LABEL_RE = re.compile(r'^[\-\s]*중요도(\s*평가)?\s*[:\-]?\s*', re.IGNORECASE)
+
 # --- 상수 (JOB_PERSONAS) ---
 JOB_PERSONAS = {
     'PROJECT_MANAGER': '당신은 프로젝트 관리자(PM)입니다. 일정, 리소스, 주요 결정사항을 중요하게 봅니다.',
@@ -30,6 +114,30 @@ JOB_PERSONAS = {
     'general': '당신은 회의록 작성 전문가입니다. 회의 내용을 명확하고 간결하게 요약합니다.'
 }
 
+# --- 통합 프롬프트 템플릿 (모듈 로드 시 1회 구성) ---
+# 대화 블록은 호출부에서 한 번만 조립해 넘기므로, 호출마다 전체 프롬프트를
+# f-string으로 재조립하지 않고 head + 대화 블록 + tail 연결만 수행합니다.
+_BATCH_PROMPT_HEAD = (
+    "[{persona}] 관점에서 다음 회의를 분석해 아래 다섯 항목을 JSON 하나로만 출력하세요.\n\n"
+    "### 항목 설명\n"
+    "- purpose: 회의의 핵심 목적. '명사형 종결 어미'(~함, ~논의 등)로 끝나는 한 문장.\n"
+    "- agenda: 주요 안건 3~5가지를 쉼표(,)로 구분한 단답형 나열. (예: 예산 확정, 일정 조율)\n"
+    "- overallSummary: 결정된 사항과 향후 계획 위주의 서술형 요약 3문장 내외.\n"
+    "- importance: 중요도 평가. 아래 기준표에 따라 엄격하게 판단.\n"
+    "- keywords: 가장 중요한 핵심 명사 키워드 5개.\n\n"
+    "### 중요도 판단 기준표\n"
+    "1. **높음 (HIGH)**: 서비스 장애(500 에러), 긴급 핫픽스, 보안 사고, 매출 직결 이슈, 데드라인 임박.\n"
+    "2. **보통 (MEDIUM)**: 정기 스프린트 회의, 일반적인 기능 개발 논의, 일정 조율, 업무 분배.\n"
+    "3. **낮음 (LOW)**: 단순 스터디 계획, 회식 장소 선정, 가벼운 아이디어 회의, 잡담 위주.\n\n"
+    "### 출력 형식 (JSON 외 다른 말은 하지 마세요)\n"
+    '{{"purpose": "...", "agenda": "...", "overallSummary": "...", '
+    '"importance": "[높음/보통/낮음] - 판단 사유 한 문장", '
+    '"keywords": ["...", "...", "...", "...", "..."]}}'
+)
+_BATCH_PROMPT_TAIL = "JSON:"
+# 'general' 페르소나(기본값)가 가장 흔한 경로이므로 head를 미리 포맷해 둡니다.
+_BATCH_PROMPT_HEAD_GENERAL = _BATCH_PROMPT_HEAD.format(persona=JOB_PERSONAS['general'])
+
 # --- Pydantic DTO ---
 class Transcript(BaseModel):
     speaker: str
@@ -66,166 +174,338 @@ class SummaryResponse(BaseModel):
     summary: Optional[Summary] = None
     error: Optional[str] = None
 
+# --- 공유 HTTP 클라이언트 (앱 생명주기 동안 1개 재사용) ---
+# 요청마다 AsyncClient를 새로 열면 매번 TCP/TLS 핸드셰이크가 발생하므로,
+# 서버 시작 시 커넥션 풀을 가진 클라이언트 하나를 만들어 재사용합니다.
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+async def init_client():
+    """FastAPI startup 이벤트에서 호출: 공유 클라이언트 + 동시성 세마포어 생성"""
+    global _CLIENT, _SEM
+    if _SEM is None:
+        # 실행 중인 루프 위에서 생성 (모듈 로드 시 만들면 3.8/3.9에서
+        # get_event_loop()의 루프에 묶여 서버 루프에서 await가 실패)
+        _SEM = asyncio.Semaphore(_MAX_CONCURRENT_CALLS)
+    if _CLIENT is None:
+        # HTTP/2 멀티플렉싱으로 동시 호출이 한 커넥션 위에서 직렬화되므로
+        # 커넥션 수는 작게, keep-alive는 길게 유지합니다.
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=32,
+                keepalive_expiry=300.0
+            )
+        )
+
+async def close_client():
+    """FastAPI shutdown 이벤트에서 호출: 공유 클라이언트 정리"""
+    global _CLIENT, _SEM
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+    _SEM = None
+
+def get_client() -> httpx.AsyncClient:
+    if _CLIENT is None:
+        raise HTTPException(status_code=503, detail="HTTP 클라이언트가 초기화되지 않았습니다.")
+    return _CLIENT
+
+async def warm_up():
+    """FastAPI startup 이벤트에서 호출: 콜드 패스를 미리 태워 첫 요청 지터 제거"""
+    # 컴파일된 패턴과 후처리 경로를 1회씩 실행해 내부 지연 초기화를 워밍
+    for pattern in (_PURPOSE_PREFIX_RE, _AGENDA_PREFIX_RE, _SUMMARY_PREFIX_RE,
+                    _KEYWORDS_PREFIX_RE, _IMP_PREFIX_RE, _LEAD_DASH_RE, _JSON_BLOCK_RE):
+        pattern.search("warmup")
+    analyze_importance("보통 - 워밍업")
+    _parse_batch_response('{"purpose": "워밍업"}')
+
+    # CLOVA 호스트로 no-op 요청을 보내 DNS 조회와 TLS 핸드셰이크를 선결제
+    if CLOVA_API_URL and _CLIENT is not None:
+        try:
+            await _CLIENT.head(CLOVA_API_URL, timeout=3.0)
+        except Exception:
+            pass  # 워밍업 실패는 무시 (연결 비용을 첫 요청이 대신 냄)
+
+# --- 정적 요청 필드 (모듈 로드 시 1회 구성) ---
+# 호출마다 바뀌는 것은 요청 ID와 messages/maxTokens뿐이므로
+# 고정 필드는 한 번만 만들고 호출 시 dict merge로 복사합니다.
+_BASE_HEADERS = {
+    'Authorization': f'Bearer {CLOVA_API_KEY}',
+    'Content-Type': 'application/json'
+}
+_BASE_BODY = {
+    "topP": 0.8,
+    "topK": 0,
+    "temperature": 0.3,
+    "repeatPenalty": 5.0,
+    "includeAiFilters": True
+}
+
+# --- 토큰 예산 라우팅 ---
+# 짧은 회의와 긴 회의가 같은 maxTokens를 쓰면 흔한 짧은 요청이 과잉 배정되므로,
+# 대화 길이의 근사 토큰 수(한글 기준 약 2자/토큰)로 예산을 이원화합니다.
+# 통합 응답 하나가 다섯 필드를 모두 담으므로 (기존 5회 호출 합산 550 상당)
+# 짧은 경로도 500은 확보해야 JSON이 중간에 잘리지 않습니다.
+_LONG_CONV_TOKENS = 2000
+_TOKEN_BUDGETS_SHORT = {'통합요약': 500}
+_TOKEN_BUDGETS_LONG = {'통합요약': 700}
+# 이 글자 수 미만의 대화는 AI 호출 없이 즉시 응답 (의미 있는 요약 불가)
+_MIN_SUMMARY_CHARS = 50
+
+def _estimate_tokens(conversation_text: str) -> int:
+    return len(conversation_text) // 2
+
+# --- 동시성 제한 + 재시도 설정 ---
+# CLOVA 엔드포인트 과부하 방지용 동시 호출 상한. 일시적 전송 오류는
+# 지수 백오프로 재시도해 사용자에게 500이 그대로 노출되지 않게 합니다.
+# 주의: Python 3.8/3.9에서는 Semaphore가 생성 시점의 이벤트 루프에 묶이므로
+# 모듈 로드 시점이 아니라 init_client()(실행 중인 루프 위)에서 생성합니다.
+_MAX_CONCURRENT_CALLS = 5
+_SEM: Optional[asyncio.Semaphore] = None
+_RETRY_EXCEPTIONS = (httpx.ReadError, httpx.ConnectError, httpx.ReadTimeout)
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_WAIT = 0.5
+_RETRY_MAX_WAIT = 4.0
+
+# --- 응답 캐시 (프로세스 로컬 LRU) ---
+# 동일 회의 재요약(재시도, 중복 호출, 재생성)은 같은 프롬프트를 만들므로,
+# 대화 해시 기준으로 응답을 재사용해 불필요한 CLOVA 왕복을 제거합니다.
+# (functools.lru_cache는 async 함수에 쓸 수 없어 OrderedDict로 직접 구현)
+_RESPONSE_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_RESPONSE_CACHE_MAX = 512
+
+def _cache_key(conversation_block: str, task_type: str, user_job: str) -> tuple:
+    conv_hash = hashlib.blake2b(conversation_block.encode(), digest_size=16).hexdigest()
+    return (conv_hash, task_type, user_job)
+
+def _cache_get(key: tuple) -> Optional[str]:
+    cached = _RESPONSE_CACHE.get(key)
+    if cached is not None:
+        _RESPONSE_CACHE.move_to_end(key)
+    return cached
+
+def _cache_put(key: tuple, value: str):
+    _RESPONSE_CACHE[key] = value
+    _RESPONSE_CACHE.move_to_end(key)
+    if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX:
+        _RESPONSE_CACHE.popitem(last=False)
+
 # --- 공통 헬퍼 함수 ---
+# uuid4는 호출마다 CSPRNG에서 16바이트를 읽으므로(시스템 콜),
+# 프로세스 태그 + 단조 시계 + 카운터 조합으로 대체합니다.
+_PROC_TAG = os.urandom(4).hex()
+_REQ_COUNTER = itertools.count()
+
 def generate_request_id():
-    return f"meeting-{int(time.time() * 1000)}-{uuid.uuid4().hex[:9]}"
+    return f"meeting-{time.monotonic_ns()}-{_PROC_TAG}{next(_REQ_COUNTER):05x}"
 
 def map_importance_to_enum(korean_level: str) -> str:
-    if '높음' in korean_level or '긴급' in korean_level or '중요' in korean_level or 'HIGH' in korean_level:
-        return "HIGH"
-    elif '낮음' in korean_level or 'LOW' in korean_level:
-        return "LOW"
-    else:
-        return "MEDIUM"
+    return _scan_keywords(korean_level.lower(), _ENUM_KEYWORDS, 'MEDIUM')
 
 def analyze_importance(summary: str) -> Importance:
-    level = '보통'
-    lower_summary = summary.lower()
-
-    if '높음' in lower_summary or 'high' in lower_summary:
-        level = '높음'
-    elif '낮음' in lower_summary or 'low' in lower_summary:
-        level = '낮음'
-    elif '보통' in lower_summary or 'medium' in lower_summary:
-        level = '보통'
+    # 우선순위 순서로 키워드를 탐색하고 첫 매치에서 중단
+    level = _classify_level(summary.lower())
 
     # 중요도 텍스트에서 불필요한 패턴 제거 및 사유 추출
-    clean_reason = re.sub(r'^[\*\-\s]*(중요도(\s*평가)?\s*[:\-]?\s*)?[\*\s]*(HIGH|MEDIUM|LOW|높음|보통|낮음)[\*\s]*[-:]?\s*', '', summary, flags=re.IGNORECASE).strip()
-    clean_reason = re.sub(r'^[\*\s]*이유\s*[:\-]?\s*', '', clean_reason, flags=re.IGNORECASE).strip()
+    clean_reason = _IMP_PREFIX_RE.sub('', summary, count=1).strip()
     
     if not clean_reason:
         clean_reason = summary
 
     return Importance(level=level, reason=clean_reason)
 
+def _parse_batch_response(raw: str) -> Dict[str, Any]:
+    """통합 프롬프트 응답(JSON)을 파싱합니다. 모델이 형식을 깨면 단계적 폴백."""
+    match = _JSON_BLOCK_RE.search(raw)
+    if match:
+        try:
+            data = orjson.loads(match.group(0))
+            if isinstance(data, dict):
+                return data
+        except orjson.JSONDecodeError:
+            pass
+
+    # 폴백 1: maxTokens 컷오프로 닫는 중괄호가 없는 잘린 JSON.
+    # 영문 키별 패턴으로 완성된 필드만 건져내 부분 요약이라도 반환합니다.
+    fields: Dict[str, Any] = {}
+    for name, pattern in _JSON_FIELD_RES.items():
+        m = pattern.search(raw)
+        if m and m.group(1).strip():
+            fields[name] = m.group(1).strip()
+    kw_match = _JSON_KEYWORDS_RE.search(raw)
+    if kw_match:
+        fields['keywords'] = [
+            s for s in (part.strip().strip('"') for part in kw_match.group(1).split(',')) if s
+        ]
+    if fields:
+        return fields
+
+    # 폴백 2: "목적: ...", "키워드: ..." 식 라벨 라인을 직접 파싱
+    for line in raw.splitlines():
+        line = _strip_markup(line).strip()
+        if not line:
+            continue
+        if _PURPOSE_PREFIX_RE.match(line):
+            fields.setdefault('purpose', _PURPOSE_PREFIX_RE.sub('', line).strip())
+        elif _AGENDA_PREFIX_RE.match(line):
+            fields.setdefault('agenda', _AGENDA_PREFIX_RE.sub('', line).strip())
+        elif _KEYWORDS_PREFIX_RE.match(line):
+            fields.setdefault('keywords', _KEYWORDS_PREFIX_RE.sub('', line).strip())
+        elif _SUMMARY_PREFIX_RE.match(line):
+            fields.setdefault('overallSummary', _SUMMARY_PREFIX_RE.sub('', line).strip())
+        elif _IMP_LABEL_RE.match(line):
+            # 라벨을 벗겨 "보통 - 사유"만 저장 (라벨의 '중요' 오탐 방지)
+            fields.setdefault('importance', _IMP_LABEL_RE.sub('', line).strip())
+    return fields
+
 # --- 공통 AI 호출 함수 ---
 async def call_hyperclova(
-    client: httpx.AsyncClient, 
-    conversation_text: str, 
-    task_type: str, 
+    client: httpx.AsyncClient,
+    conversation_block: str,
+    task_type: str,
     user_job: str = 'general',
-    user_name: Optional[str] = None
+    user_name: Optional[str] = None,
+    long_conversation: bool = False
 ) -> str:
 
     persona_general = JOB_PERSONAS['general']
     persona_user = JOB_PERSONAS.get(user_job, persona_general)
 
-    # 프롬프트 설정 (중요도 기준 명시)
-    prompts = {
-        '회의목적': f"다음 회의의 핵심 목적을 '명사형 종결 어미'(~함, ~논의 등)로 끝나는 한 문장으로 요약하세요.\n\n[대화]\n{conversation_text}\n\n회의 목적:",
-        '주요안건': f"회의에서 논의된 주요 안건 3~5가지를 쉼표(,)로 구분하여 단답형으로 나열하세요. (예: 예산 확정, 일정 조율)\n\n[대화]\n{conversation_text}\n\n주요 안건:",
-        '전체요약': f"회의 내용을 서술형으로 자연스럽게 요약하세요. 결정된 사항과 향후 계획 위주로 3문장 내외로 작성하세요.\n\n[대화]\n{conversation_text}\n\n전체 요약:",
-        
-        '중요도': (
-            f"[{persona_user}] 관점에서 이 회의의 중요도를 엄격하게 평가하세요.\n\n"
-            f"### [판단 기준표]\n"
-            f"1. **높음 (HIGH)**: 서비스 장애(500 에러), 긴급 핫픽스, 보안 사고, 매출 직결 이슈, 데드라인 임박.\n"
-            f"2. **보통 (MEDIUM)**: 정기 스프린트 회의, 일반적인 기능 개발 논의, 일정 조율, 업무 분배.\n"
-            f"3. **낮음 (LOW)**: 단순 스터디 계획, 회식 장소 선정, 가벼운 아이디어 회의, 잡담 위주.\n\n"
-            f"### 출력 형식\n"
-            f"[높음/보통/낮음] - [판단 사유 한 문장]\n\n"
-            f"[대화]\n{conversation_text}\n\n평가:"
-        ),
-        
-        '키워드': f"[{persona_user}] 관점에서 가장 중요한 핵심 명사 키워드 5개를 쉼표로 구분해 추출하세요.\n\n[대화]\n{conversation_text}\n\n키워드:"
-    }
+    if task_type != '통합요약':
+        raise ValueError(f"지원하지 않는 task_type입니다: {task_type}")
 
-    system_content = persona_general
-    if task_type in ('중요도', '키워드'):
-        system_content = persona_user
+    # 동일 (대화, 작업, 직무) 조합이면 네트워크 없이 캐시 응답 반환
+    cache_key = _cache_key(conversation_block, task_type, user_job)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
 
-    token_settings = {
-        '회의목적': 100, '주요안건': 100, '전체요약': 200,
-        '중요도': 100, '키워드': 50
-    }
+    # head(템플릿 상수) + 대화 블록(호출부에서 1회 조립) + tail 연결만 수행
+    # 기본 페르소나는 미리 포맷된 head를 그대로 사용 (포맷 비용 생략)
+    if persona_user is persona_general:
+        head = _BATCH_PROMPT_HEAD_GENERAL
+    else:
+        head = _BATCH_PROMPT_HEAD.format(persona=persona_user)
+    prompt = head + conversation_block + _BATCH_PROMPT_TAIL
+
+    system_content = persona_user
+
+    token_settings = _TOKEN_BUDGETS_LONG if long_conversation else _TOKEN_BUDGETS_SHORT
     current_max_tokens = token_settings.get(task_type, 500)
 
-    headers = {
-        'Authorization': f'Bearer {CLOVA_API_KEY}',
-        'Content-Type': 'application/json',
-        'X-NCP-CLOVASTUDIO-REQUEST-ID': generate_request_id()
-    }
+    headers = {**_BASE_HEADERS, 'X-NCP-CLOVASTUDIO-REQUEST-ID': generate_request_id()}
 
     body = {
+        **_BASE_BODY,
         "messages": [
             {"role": "system", "content": system_content},
-            {"role": "user", "content": prompts[task_type]}
+            {"role": "user", "content": prompt}
         ],
-        "topP": 0.8,
-        "topK": 0,
-        "maxTokens": current_max_tokens,
-        "temperature": 0.3,
-        "repeatPenalty": 5.0,
-        "includeAiFilters": True
+        "maxTokens": current_max_tokens
     }
 
     try:
-        response = await client.post(CLOVA_API_URL, headers=headers, json=body, timeout=30.0)
-        response.raise_for_status() 
-        data = response.json()
+        response = None
+        for attempt in range(_RETRY_ATTEMPTS):
+            try:
+                async with _SEM:
+                    response = await client.post(CLOVA_API_URL, headers=headers, json=body, timeout=30.0)
+                break
+            except _RETRY_EXCEPTIONS as e:
+                if attempt == _RETRY_ATTEMPTS - 1:
+                    raise
+                wait = min(_RETRY_BASE_WAIT * (2 ** attempt), _RETRY_MAX_WAIT)
+                logger.warning("CLOVA 일시 오류, %s초 후 재시도 (%d/%d): %s", wait, attempt + 1, _RETRY_ATTEMPTS, e)
+                await asyncio.sleep(wait)
+        response.raise_for_status()
+        # stdlib json 대비 2~5배 빠르고 중간 str 디코드가 없음
+        data = orjson.loads(response.content)
 
         if data.get("status") and data["status"].get("code") != "20000":
             raise HTTPException(status_code=500, detail=f"HyperCLOVA API 오류: {data['status'].get('message')}")
 
         result_text = data.get("result", {}).get("message", {}).get("content", "") or \
-                      data.get("result", {}).get("text", "") 
-        return result_text.strip()
+                      data.get("result", {}).get("text", "")
+        result_text = result_text.strip()
+        _cache_put(cache_key, result_text)
+        return result_text
 
     except Exception as e:
-        print(f"API 호출 오류: {e}")
+        logger.error("API 호출 오류: %s", e)
         raise HTTPException(status_code=500, detail=f"API 호출 오류: {e}")
 
 # --- AI 요약 생성 로직 ---
 async def create_summary(request: SummaryRequest) -> Summary:
-    conversation_lines = []
-    for t in request.transcripts:
-        display_name = request.speakerMapping.get(t.speaker, t.speaker)
-        conversation_lines.append(f"{display_name} ({t.time}): {t.text}")
-    conversation_text = "\n".join(conversation_lines)
+    if not request.transcripts:
+        raise HTTPException(status_code=400, detail="요약할 대화 내용이 없습니다.")
+
+    # 긴 회의에서는 이 조립 루프가 네트워크 외 핫스팟이므로,
+    # 바운드 메서드 조회를 루프 밖으로 빼고 중간 리스트 없이 join
+    mapping_get = request.speakerMapping.get
+    conversation_text = "\n".join(
+        f"{mapping_get(t.speaker, t.speaker)} ({t.time}): {t.text}"
+        for t in request.transcripts
+    )
+
+    # 요약할 내용이 사실상 없는 대화는 5회분 LLM 비용 없이 즉시 응답
+    total_chars = sum(len(t.text) for t in request.transcripts)
+    if total_chars < _MIN_SUMMARY_CHARS:
+        logger.info("대화가 너무 짧아 AI 호출 생략 (%d자)", total_chars)
+        return Summary(
+            purpose="",
+            agenda="",
+            overallSummary=conversation_text,
+            importance="LOW",
+            keywords=[],
+            actions=[]
+        )
 
     user_job = request.userJob
-    print(f"[{user_job}] 요약 생성 시작")
+    logger.info("[%s] 요약 생성 시작", user_job)
 
-    async with httpx.AsyncClient() as client:
-        try:
-            tasks = [
-                call_hyperclova(client, conversation_text, '회의목적', user_job),
-                call_hyperclova(client, conversation_text, '주요안건', user_job),
-                call_hyperclova(client, conversation_text, '전체요약', user_job),
-                call_hyperclova(client, conversation_text, '중요도', user_job),
-                call_hyperclova(client, conversation_text, '키워드', user_job)
-            ]
-            results = await asyncio.gather(*tasks)
-            purpose_raw, agenda_raw, summary_raw, importance_raw, keywords_raw = results
-
-            def clean_text(text, prefix_pattern):
-                text = re.sub(r'\*\*|__|\#\#|\#', '', text)
-                text = re.sub(prefix_pattern, '', text, flags=re.IGNORECASE)
-                return text.replace('"', '').replace("'", "").strip()
-
-            purpose = clean_text(purpose_raw, r'^(회의\s*)?목적\s*[:\-]?\s*')
-            agenda = clean_text(agenda_raw, r'^(주요\s*)?안건\s*[:\-]?\s*')
-            summary_text = clean_text(summary_raw, r'^(전체\s*)?요약\s*[:\-]?\s*')
-
-            importance_obj = analyze_importance(importance_raw)
-            enum_value = map_importance_to_enum(importance_obj.level)
-            
-            clean_reason = re.sub(r'^[\-\s]*', '', importance_obj.reason)
-            final_summary = f"{summary_text}\n\n(중요도 판정 사유: {clean_reason})"
-
-            keywords_text = clean_text(keywords_raw, r'^키워드\s*[:\-]?\s*')
-            keywords = [k.strip() for k in keywords_text.split(',') if k.strip()]
-
-            summary_data = Summary(
-                purpose=purpose,
-                agenda=agenda,
-                overallSummary=final_summary,
-                importance=enum_value,
-                keywords=keywords,
-                actions=[]
-            )
-            return summary_data
+    # 대화 블록은 여기서 1회만 조립 (prefix 공유)
+    conversation_block = f"\n\n[대화]\n{conversation_text}\n\n"
 
-        except Exception as e:
-            print(f"요약 생성 실패: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+    client = get_client()
+    try:
+        # 대화가 동일하므로 5개 항목을 한 번의 호출로 받음 (왕복 5회 → 1회)
+        # 대화 길이에 따라 디코드 예산(maxTokens)을 이원 배정
+        is_long = _estimate_tokens(conversation_text) > _LONG_CONV_TOKENS
+        result_raw = await call_hyperclova(
+            client, conversation_block, '통합요약', user_job,
+            long_conversation=is_long
+        )
+        fields = _parse_batch_response(result_raw)
+
+        purpose = _strip_markup(str(fields.get('purpose', ''))).strip()
+        agenda = _strip_markup(str(fields.get('agenda', ''))).strip()
+        summary_text = _strip_markup(str(fields.get('overallSummary', ''))).strip()
+
+        importance_raw = str(fields.get('importance', ''))
+        importance_obj = analyze_importance(importance_raw)
+        enum_value = map_importance_to_enum(importance_obj.level)
+
+        clean_reason = _LEAD_DASH_RE.sub('', importance_obj.reason)
+        final_summary = f"{summary_text}\n\n(중요도 판정 사유: {clean_reason})"
+
+        keywords_field = fields.get('keywords', [])
+        if isinstance(keywords_field, str):
+            keywords_field = keywords_field.split(',')
+        # translate로 정크 제거와 필터링을 한 패스에 처리 (정규식 불필요)
+        keywords = [s for s in (str(kw).translate(_KW_JUNK).strip() for kw in keywords_field) if s]
+
+        summary_data = Summary(
+            purpose=purpose,
+            agenda=agenda,
+            overallSummary=final_summary,
+            importance=enum_value,
+            keywords=keywords,
+            actions=[]
+        )
+        return summary_data
+
+    except Exception as e:
+        logger.error("요약 생성 실패: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file